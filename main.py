@@ -1,10 +1,17 @@
 import machine
 import time
 
+BLINK_INTERVAL_MS = 1000
+
 led = machine.Pin(2, machine.Pin.OUT)
 
+state = 0
+deadline = time.ticks_ms()
+
 while True:
-    led.on()
-    time.sleep(1)
-    led.off()
-    time.sleep(1)
\ No newline at end of file
+    state ^= 1
+    led.value(state)
+    deadline = time.ticks_add(deadline, BLINK_INTERVAL_MS)
+    remaining = time.ticks_diff(deadline, time.ticks_ms())
+    if remaining > 0:
+        time.sleep_ms(remaining)
\ No newline at end of file